@@ -5,74 +5,25 @@ Generates professional README.md files for GitHub repositories using customizabl
 """
 
 import os
+import re
 import sys
-import json
-import argparse
+import string
+import operator
 from pathlib import Path
 from typing import Dict, Any, Optional
-import requests
-from datetime import datetime
 
+# requests, json/orjson, concurrent.futures, argparse and datetime are imported where they are
+# used so that start-up (e.g. --create-template) does not pay for modules it never touches
 
-class GitHubAPIClient:
-    """Client for interacting with GitHub API"""
-    
-    def __init__(self, token: Optional[str] = None):
-        self.token = token or os.environ.get('GITHUB_TOKEN')
-        self.base_url = "https://api.github.com"
-        self.headers = {
-            "Accept": "application/vnd.github.v3+json"
-        }
-        if self.token:
-            self.headers["Authorization"] = f"token {self.token}"
-    
-    def get_repo_info(self, owner: str, repo: str) -> Dict[str, Any]:
-        """Fetch repository information from GitHub API"""
-        url = f"{self.base_url}/repos/{owner}/{repo}"
-        response = requests.get(url, headers=self.headers)
-        
-        if response.status_code == 404:
-            raise ValueError(f"Repository {owner}/{repo} not found")
-        elif response.status_code == 403:
-            raise ValueError("API rate limit exceeded. Set GITHUB_TOKEN environment variable.")
-        elif response.status_code != 200:
-            raise ValueError(f"GitHub API error: {response.status_code}")
-        
-        return response.json()
-    
-    def get_languages(self, owner: str, repo: str) -> Dict[str, int]:
-        """Fetch repository languages"""
-        url = f"{self.base_url}/repos/{owner}/{repo}/languages"
-        response = requests.get(url, headers=self.headers)
-        
-        if response.status_code == 200:
-            return response.json()
-        return {}
-    
-    def get_readme_content(self, owner: str, repo: str) -> Optional[str]:
-        """Fetch existing README if it exists"""
-        url = f"{self.base_url}/repos/{owner}/{repo}/readme"
-        response = requests.get(url, headers=self.headers)
-        
-        if response.status_code == 200:
-            return response.json().get('content', '')
-        return None
+# Matches owner/repo, optionally prefixed by a scheme and host
+_REPO_RE = re.compile(r'^(?:https?://[^/]+/)?([^/]+)/([^/]+?)/?$')
 
+# English month names, so formatted dates do not depend on the locale
+_MONTHS = ('January', 'February', 'March', 'April', 'May', 'June', 'July',
+           'August', 'September', 'October', 'November', 'December')
 
-class TemplateEngine:
-    """Template engine for README generation"""
-    
-    def __init__(self, template_path: Optional[Path] = None):
-        self.template_path = template_path
-        if template_path and template_path.exists():
-            self.template = template_path.read_text(encoding='utf-8')
-        else:
-            self.template = self.get_default_template()
-    
-    @staticmethod
-    def get_default_template() -> str:
-        """Returns the default README template"""
-        return """# {repo_name}
+# Template used when no custom template is supplied
+_DEFAULT_TEMPLATE = """# {repo_name}
 
 {description}
 
@@ -128,6 +79,161 @@ Contributions are welcome! Please feel free to submit a Pull Request.
 
 *This README was generated on {generation_date}*
 """
+
+
+class GitHubAPIClient:
+    """Client for interacting with GitHub API"""
+    
+    def __init__(self, token: Optional[str] = None, cache_dir: Optional[Path] = None):
+        self.token = token or os.environ.get('GITHUB_TOKEN')
+        self.base_url = "https://api.github.com"
+        self.cache_dir = cache_dir or Path.home() / '.cache' / 'readme_agent'
+        self.headers = {
+            "Accept": "application/vnd.github.v3+json"
+        }
+        if self.token:
+            self.headers["Authorization"] = f"token {self.token}"
+        
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        # orjson decodes API responses considerably faster; fall back to the stdlib
+        try:
+            from orjson import loads as json_loads
+        except ImportError:
+            from json import loads as json_loads
+        self._json_loads = json_loads
+        
+        # Reuse one keep-alive connection for all API calls
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=4,
+            # raise_on_status=False returns the final 5xx so callers' status checks still apply
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504],
+                              raise_on_status=False)
+        ))
+    
+    def _cache_file(self, url: str) -> Path:
+        """Map an API URL to its cache file, e.g. /repos/owner/repo/languages -> owner/repo/languages.json"""
+        owner, repo, *endpoint = url[len(f"{self.base_url}/repos/"):].split('/', 2)
+        return self.cache_dir / owner / repo / f"{endpoint[0] if endpoint else 'repo'}.json"
+    
+    def _cached_get(self, url: str, accept: Optional[str] = None) -> tuple[int, Any]:
+        """GET a URL, revalidating any cached copy with ETag/Last-Modified.
+        
+        Returns (status_code, body). A 304 response is served from the cache
+        and reported as 200; body is None for any other non-200 status.
+        If accept is given it overrides the Accept header and the body is
+        returned as text instead of decoded JSON.
+        """
+        import json
+        
+        cache_file = self._cache_file(url)
+        cached = None
+        try:
+            with cache_file.open(encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            pass
+        # Only trust entries that can actually answer a 304
+        if not isinstance(cached, dict) or 'body' not in cached:
+            cached = None
+        
+        headers = {}
+        if accept:
+            headers['Accept'] = accept
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+        
+        response = self.session.get(url, headers=headers)
+        
+        if response.status_code == 304 and cached:
+            return 200, cached['body']
+        if response.status_code != 200:
+            return response.status_code, None
+        
+        body = response.text if accept else self._json_loads(response.content)
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with cache_file.open('w', encoding='utf-8') as f:
+                json.dump({
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified'),
+                    'body': body
+                }, f)
+        except OSError:
+            pass
+        
+        return 200, body
+    
+    def get_repo_info(self, owner: str, repo: str) -> Dict[str, Any]:
+        """Fetch repository information from GitHub API"""
+        url = f"{self.base_url}/repos/{owner}/{repo}"
+        status, body = self._cached_get(url)
+        
+        if status == 404:
+            raise ValueError(f"Repository {owner}/{repo} not found")
+        elif status == 403:
+            raise ValueError("API rate limit exceeded. Set GITHUB_TOKEN environment variable.")
+        elif status != 200:
+            raise ValueError(f"GitHub API error: {status}")
+        
+        return body
+    
+    def get_languages(self, owner: str, repo: str) -> Dict[str, int]:
+        """Fetch repository languages, reusing the cached histogram when unchanged"""
+        url = f"{self.base_url}/repos/{owner}/{repo}/languages"
+        status, body = self._cached_get(url)
+        
+        if status == 200:
+            return body
+        return {}
+    
+    def get_readme_content(self, owner: str, repo: str) -> Optional[str]:
+        """Fetch existing README if it exists, as raw text rather than base64 JSON"""
+        url = f"{self.base_url}/repos/{owner}/{repo}/readme"
+        status, body = self._cached_get(url, accept="application/vnd.github.raw")
+        
+        if status == 200:
+            return body
+        return None
+    
+    def fetch_all(self, owner: str, repo: str,
+                  include_readme: bool = False) -> tuple[Dict[str, Any], Dict[str, int], Optional[str]]:
+        """Fetch repository info, languages and (optionally) README concurrently"""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        with ThreadPoolExecutor(max_workers=3 if include_readme else 2) as executor:
+            repo_info = executor.submit(self.get_repo_info, owner, repo)
+            languages = executor.submit(self.get_languages, owner, repo)
+            readme = executor.submit(self.get_readme_content, owner, repo) if include_readme else None
+            
+            # result() re-raises errors such as a 404 from get_repo_info
+            return repo_info.result(), languages.result(), readme.result() if readme else None
+
+
+class TemplateEngine:
+    """Template engine for README generation"""
+    
+    def __init__(self, template_path: Optional[Path] = None):
+        self.template_path = template_path
+        if template_path and template_path.exists():
+            self.template = template_path.read_text(encoding='utf-8')
+        else:
+            self.template = self.get_default_template()
+        # Check the str.format syntax up front; raises ValueError for unbalanced braces
+        list(string.Formatter().parse(self.template))
+    
+    @staticmethod
+    def get_default_template() -> str:
+        """Returns the default README template"""
+        return _DEFAULT_TEMPLATE
     
     def render(self, data: Dict[str, Any]) -> str:
         """Render the template with provided data"""
@@ -143,92 +249,89 @@ class ReadmeGenerator:
     
     def parse_repo_url(self, repo_identifier: str) -> tuple[str, str]:
         """Parse repository URL or owner/repo format"""
-        # Handle full GitHub URLs
-        if repo_identifier.startswith('http'):
-            parts = repo_identifier.rstrip('/').split('/')
-            return parts[-2], parts[-1]
-        
-        # Handle owner/repo format
-        if '/' in repo_identifier:
-            owner, repo = repo_identifier.split('/', 1)
-            return owner, repo
-        
-        raise ValueError("Invalid repository format. Use 'owner/repo' or full GitHub URL")
+        # Handles both full GitHub URLs and owner/repo format
+        match = _REPO_RE.match(repo_identifier)
+        if not match:
+            raise ValueError("Invalid repository format. Use 'owner/repo' or full GitHub URL")
+        return match.group(1), match.group(2)
     
     def extract_data(self, repo_info: Dict[str, Any], languages: Dict[str, int]) -> Dict[str, Any]:
         """Extract and format data for template"""
+        from datetime import datetime
         
-        # Calculate primary language
-        primary_language = "Not specified"
-        if languages:
-            primary_language = max(languages.items(), key=lambda x: x[1])[0]
+        generation_date = datetime.now().isoformat(sep=' ', timespec='seconds')
+        g = repo_info.get
+        owner_info = g('owner') or {}
         
-        # Format tech stack
-        tech_stack = self._format_tech_stack(languages)
+        # Format tech stack and pick the primary language from it
+        tech_stack, primary_language = self._format_tech_stack(languages)
         
         # Format dates
-        created_date = self._format_date(repo_info.get('created_at', ''))
-        updated_date = self._format_date(repo_info.get('updated_at', ''))
+        created_date = self._format_date(g('created_at', ''))
+        updated_date = self._format_date(g('updated_at', ''))
         
         # License info
         license_info = "No license specified"
         license_name = "None"
-        if repo_info.get('license'):
-            license_name = repo_info['license'].get('name', 'Unknown')
-            license_spdx = repo_info['license'].get('spdx_id', '')
+        license_data = g('license')
+        if license_data:
+            license_name = license_data.get('name', 'Unknown')
+            license_spdx = license_data.get('spdx_id', '')
             if license_spdx:
                 license_info = f"This project is licensed under the {license_name} License."
         
         # Homepage link
         homepage_link = ""
-        if repo_info.get('homepage'):
-            homepage_link = f"- **Homepage:** [{repo_info['homepage']}]({repo_info['homepage']})"
+        homepage = g('homepage')
+        if homepage:
+            homepage_link = f"- **Homepage:** [{homepage}]({homepage})"
         
         return {
-            'repo_name': repo_info.get('name', 'Repository'),
-            'owner': repo_info.get('owner', {}).get('login', ''),
-            'description': repo_info.get('description', 'No description provided.'),
-            'overview': repo_info.get('description', 'Add a detailed overview of your project here.'),
+            'repo_name': g('name', 'Repository'),
+            'owner': owner_info.get('login', ''),
+            'description': g('description', 'No description provided.'),
+            'overview': g('description', 'Add a detailed overview of your project here.'),
             'features': '- Feature 1: Add your features here\n- Feature 2: Describe key capabilities\n- Feature 3: Highlight unique aspects',
             'install_instructions': '```bash\n# Add installation commands here\n```',
             'usage_instructions': '```bash\n# Add usage examples here\n```',
             'tech_stack': tech_stack,
             'created_date': created_date,
             'updated_date': updated_date,
-            'stars': repo_info.get('stargazers_count', 0),
-            'forks': repo_info.get('forks_count', 0),
-            'open_issues': repo_info.get('open_issues_count', 0),
+            'stars': g('stargazers_count', 0),
+            'forks': g('forks_count', 0),
+            'open_issues': g('open_issues_count', 0),
             'license': license_name,
             'license_info': license_info,
             'primary_language': primary_language,
-            'repo_url': repo_info.get('html_url', ''),
+            'repo_url': g('html_url', ''),
             'homepage_link': homepage_link,
-            'generation_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            'generation_date': generation_date
         }
     
-    def _format_tech_stack(self, languages: Dict[str, int]) -> str:
-        """Format languages into a readable tech stack"""
+    def _format_tech_stack(self, languages: Dict[str, int]) -> tuple[str, str]:
+        """Format languages into a readable tech stack, returning it with the primary language"""
         if not languages:
-            return "- Language information not available"
+            return "- Language information not available", "Not specified"
         
         total = sum(languages.values())
-        stack_lines = []
-        
-        for lang, bytes_count in sorted(languages.items(), key=lambda x: x[1], reverse=True):
-            percentage = (bytes_count / total) * 100
-            stack_lines.append(f"- **{lang}:** {percentage:.1f}%")
+        ranked = sorted(languages.items(), key=operator.itemgetter(1), reverse=True)
+        tech_stack = '\n'.join(
+            f"- **{lang}:** {bytes_count / total * 100:.1f}%" for lang, bytes_count in ranked
+        )
         
-        return '\n'.join(stack_lines)
+        return tech_stack, ranked[0][0]
     
     def _format_date(self, date_str: str) -> str:
         """Format ISO date string to readable format"""
         if not date_str:
             return "Unknown"
+        from datetime import datetime
         try:
-            dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-            return dt.strftime('%B %d, %Y')
-        except:
+            iso_str = date_str[:-1] + '+00:00' if date_str.endswith('Z') else date_str
+            dt = datetime.fromisoformat(iso_str)
+        except (ValueError, TypeError, AttributeError):
             return date_str
+        return f"{_MONTHS[dt.month - 1]} {dt.day:02d}, {dt.year}"
     
     def generate(self, repo_identifier: str, output_path: Optional[Path] = None) -> str:
         """Generate README for specified repository"""
@@ -239,8 +342,7 @@ class ReadmeGenerator:
         print(f"Fetching repository information for {owner}/{repo}...")
         
         # Fetch data from GitHub
-        repo_info = self.api_client.get_repo_info(owner, repo)
-        languages = self.api_client.get_languages(owner, repo)
+        repo_info, languages, _ = self.api_client.fetch_all(owner, repo)
         
         print(f"Repository found: {repo_info.get('full_name')}")
         print(f"Description: {repo_info.get('description', 'No description')}")
@@ -255,7 +357,7 @@ class ReadmeGenerator:
         if output_path is None:
             output_path = Path.cwd() / f"{repo}_README.md"
         
-        output_path.write_text(readme_content, encoding='utf-8')
+        output_path.write_bytes(readme_content.encode('utf-8'))
         
         print(f"\n✓ README generated successfully!")
         print(f"✓ Saved to: {output_path.absolute()}")
@@ -264,6 +366,8 @@ class ReadmeGenerator:
 
 
 def main():
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description='Generate professional README.md files for GitHub repositories',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -287,6 +391,7 @@ Note: Set GITHUB_TOKEN environment variable to avoid API rate limits.
     )
     
     parser.add_argument('repository',
+                       nargs='?',
                        help='GitHub repository (owner/repo or full URL)')
     
     parser.add_argument('-o', '--output',
@@ -314,6 +419,11 @@ Note: Set GITHUB_TOKEN environment variable to avoid API rate limits.
         print("  Edit this file to customize your README template.")
         return 0
     
+    if not args.repository:
+        parser.error('the following arguments are required: repository')
+    
+    import requests
+    
     try:
         # Create generator
         generator = ReadmeGenerator(